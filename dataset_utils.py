@@ -11,11 +11,16 @@ Two small steps are involved:
     Reads ``dataset.txt`` (or another file following the same format) and
     extracts ``(tag, description)`` tuples.  The helper is robust to
     multi-line descriptions and gracefully skips headings or blank lines.
+    Callers can opt into caching the parsed results in a pickle beside the
+    dataset so repeated loads skip the parse.  Every description it returns
+    is whitespace normalised: no leading or trailing whitespace and single
+    spaces inside.
 
 ``build_prompt_completion_pairs``
     Converts the ``(tag, description)`` tuples into dictionaries that follow
     the common prompt/completion JSONL convention used by many LLM training
-    utilities.
+    utilities.  It relies on the normalisation above and does not strip the
+    descriptions again.
 
 Both helpers are lightweight and avoid pulling heavy dependencies so that they
 can be used in simple data preparation scripts and unit tests.
@@ -24,9 +29,19 @@ can be used in simple data preparation scripts and unit tests.
 from __future__ import annotations
 
 import json
+import os
+import pickle
 import re
+import struct
+import sys
+from itertools import islice
 from pathlib import Path
-from typing import Iterable, List, MutableSequence, Sequence, Tuple
+from typing import Iterable, List, Sequence, Tuple
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - orjson is an optional speed-up
+    orjson = None  # type: ignore[assignment]
 
 __all__ = [
     "load_html_tag_dataset",
@@ -35,18 +50,124 @@ __all__ = [
 ]
 
 
-_TAG_PATTERN = re.compile(r"<[^>]+>")
+# Tags never span lines, which lets the pattern be applied to the whole file.
+_TAG_PATTERN = re.compile(r"<[^>\n]+>")
+
+# Matches the run of non-blank lines that follows a tag line, stopping at the
+# first line that contains a tag of its own.  A line is tag-free when every
+# ``<`` in it is immediately closed (``<>``) or never closed at all.
+_DESCRIPTION_PATTERN = re.compile(
+    r"(?:\n(?![^\S\n]*$)[^<\n]*(?:<>[^<\n]*)*(?:<[^>\n]*)?$)*",
+    re.MULTILINE,
+)
+
+# Parsed datasets can be cached next to the source file.  The header ties the
+# cache to the exact file it was built from (name, modification time and size)
+# and to the cache format, so any edit to the dataset triggers a fresh parse.
+_CACHE_HEADER = struct.Struct("<8sqqH")
+_CACHE_MAGIC = b"HTMLTAG2"
+
+# Records are serialised in batches so each batch costs a single ``write``
+# call without holding an arbitrarily large dataset in memory at once.
+_JSONL_BATCH_SIZE = 4096
+
+
+def _encode_jsonl_batch(batch: Sequence[dict[str, str]]) -> bytes:
+    """Serialise ``batch`` as UTF-8 JSONL, one compact object per line."""
+
+    if orjson is not None:
+        return b"\n".join(map(orjson.dumps, batch)) + b"\n"
+    # Match orjson's compact output so the file does not depend on which
+    # serialiser happens to be installed.
+    lines = [
+        json.dumps(record, ensure_ascii=False, separators=(",", ":"))
+        for record in batch
+    ]
+    return ("\n".join(lines) + "\n").encode("utf-8")
 
 
-def _looks_like_tag_line(line: str) -> bool:
-    """Return ``True`` when ``line`` resembles an HTML tag declaration."""
+def _parse_html_tag_text(raw_text: str) -> List[Tuple[str, str]]:
+    """Extract ``(tag, description)`` tuples from the dataset's text."""
 
-    if not line:
-        return False
-    return bool(_TAG_PATTERN.search(line))
+    # Re-join with plain newlines so that every line boundary recognised by
+    # ``str.splitlines`` is visible to the line-anchored patterns below.
+    text = "\n".join(raw_text.splitlines())
 
+    pairs: List[Tuple[str, str]] = []
+    # Jump from tag to tag with the regex engine instead of inspecting every
+    # line: anything between a description and the next tag is a heading.
+    tag_match = _TAG_PATTERN.search(text)
+    while tag_match:
+        line_start = text.rfind("\n", 0, tag_match.start()) + 1
+        line_end = text.find("\n", tag_match.end())
+        if line_end == -1:
+            line_end = len(text)
+        description_match = _DESCRIPTION_PATTERN.match(text, line_end)
+        # Normalise whitespace so that descriptions look tidy when fed to an
+        # LLM training pipeline.
+        description = " ".join(description_match.group().split())
+        if description:
+            # Tags end up as dictionary keys and are looked up repeatedly, so
+            # intern them to share storage and speed up key comparisons.
+            tag = sys.intern(text[line_start:line_end].strip())
+            pairs.append((tag, description))
+        tag_match = _TAG_PATTERN.search(text, description_match.end())
+    return pairs
 
-def load_html_tag_dataset(path: Path | str) -> List[Tuple[str, str]]:
+
+def _cache_header(dataset_path: Path, stat: os.stat_result) -> bytes:
+    """Return the header identifying a cache built from ``dataset_path``."""
+
+    name = os.fsencode(dataset_path.name)
+    fixed = _CACHE_HEADER.pack(
+        _CACHE_MAGIC, stat.st_mtime_ns, stat.st_size, len(name)
+    )
+    return fixed + name
+
+
+def _read_cached_pairs(
+    cache_path: Path, header: bytes
+) -> List[Tuple[str, str]] | None:
+    """Return the cached pairs when ``cache_path`` matches ``header``."""
+
+    try:
+        blob = cache_path.read_bytes()
+    except OSError:
+        return None
+    if not blob.startswith(header):
+        return None
+    try:
+        return pickle.loads(memoryview(blob)[len(header):])
+    except Exception:  # pragma: no cover - corrupt or incompatible cache
+        return None
+
+
+def _write_cached_pairs(
+    cache_path: Path, header: bytes, pairs: List[Tuple[str, str]]
+) -> None:
+    """Best-effort atomic write of ``pairs`` to ``cache_path``."""
+
+    payload = pickle.dumps(pairs, protocol=pickle.HIGHEST_PROTOCOL)
+    # A per-process name keeps concurrent writers apart without paying for the
+    # ``tempfile`` import on every start-up.
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        try:
+            with tmp_path.open("wb") as fh:
+                fh.write(header)
+                fh.write(payload)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+    except OSError:
+        # The cache is only an optimisation; read-only checkouts still work.
+        pass
+
+
+def load_html_tag_dataset(
+    path: Path | str, *, cache: bool = False
+) -> List[Tuple[str, str]]:
     """Parse ``dataset.txt`` into ``(tag, description)`` tuples.
 
     Parameters
@@ -54,6 +175,13 @@ def load_html_tag_dataset(path: Path | str) -> List[Tuple[str, str]]:
     path:
         Location of the text dataset.  Either a :class:`pathlib.Path` instance
         or a plain string.
+    cache:
+        When ``True`` the parsed pairs are pickled next to the dataset
+        (``dataset.txt.pkl`` for ``dataset.txt``) and reused for as long as the
+        dataset's name, modification time and size are unchanged.  Off by
+        default so that loading never writes beside the caller's input.  The
+        header is not a signature and the pickle is loaded as-is, so only
+        enable this for directories you trust.
 
     Returns
     -------
@@ -63,43 +191,22 @@ def load_html_tag_dataset(path: Path | str) -> List[Tuple[str, str]]:
     """
 
     dataset_path = Path(path)
-    raw_lines = dataset_path.read_text(encoding="utf-8").splitlines()
-
-    pairs: List[Tuple[str, str]] = []
-    current_tag: str | None = None
-    description_lines: MutableSequence[str] = []
-
-    def flush_current() -> None:
-        nonlocal current_tag, description_lines
-        if current_tag and description_lines:
-            description = " ".join(part.strip() for part in description_lines)
-            # Normalise whitespace so that descriptions look tidy when fed to
-            # an LLM training pipeline.
-            description = " ".join(description.split())
-            pairs.append((current_tag, description))
-        current_tag = None
-        description_lines = []
-
-    for raw_line in raw_lines:
-        line = raw_line.strip()
-        if not line:
-            # Blank lines simply separate sections – flush accumulated text.
-            flush_current()
-            continue
-
-        if _looks_like_tag_line(line):
-            flush_current()
-            current_tag = line
-            continue
-
-        if current_tag is None:
-            # Skip headings or explanatory text that is not tied to a tag.
-            continue
-
-        description_lines.append(line)
-
-    # Capture the trailing pair (if any) once the loop finishes.
-    flush_current()
+    cache_path = dataset_path.with_name(dataset_path.name + ".pkl")
+    if cache and cache_path.resolve() == dataset_path.resolve():
+        # Never let the cache overwrite the dataset it was built from.
+        cache = False
+    if cache:
+        header = _cache_header(dataset_path, dataset_path.stat())
+        cached = _read_cached_pairs(cache_path, header)
+        if cached is not None:
+            # Unpickled strings are fresh objects; intern them like a parse would.
+            return [(sys.intern(tag), description) for tag, description in cached]
+
+    # Decode the raw bytes directly rather than going through a text-mode file
+    # object; ``splitlines`` takes care of ``\r\n`` and friends.
+    pairs = _parse_html_tag_text(dataset_path.read_bytes().decode("utf-8"))
+    if cache:
+        _write_cached_pairs(cache_path, header, pairs)
     return pairs
 
 
@@ -108,17 +215,20 @@ def build_prompt_completion_pairs(
     *,
     instruction: str = "Describe the HTML element",
 ) -> List[dict[str, str]]:
-    """Turn ``(tag, description)`` tuples into prompt/completion dictionaries."""
+    """Turn ``(tag, description)`` tuples into prompt/completion dictionaries.
+
+    Descriptions are used verbatim, so they should already be normalised as
+    returned by :func:`load_html_tag_dataset`.
+    """
 
-    results: List[dict[str, str]] = []
-    for tag, description in pairs:
-        prompt = f"{instruction} `{tag}`."
-        # Fine-tuning utilities such as the OpenAI JSONL format expect the
-        # completion to start with a leading space so that the model learns to
-        # separate the prompt from the answer.
-        completion = " " + description.strip()
-        results.append({"prompt": prompt, "completion": completion})
-    return results
+    prefix = f"{instruction} `"
+    # Fine-tuning utilities such as the OpenAI JSONL format expect the
+    # completion to start with a leading space so that the model learns to
+    # separate the prompt from the answer.
+    return [
+        {"prompt": f"{prefix}{tag}`.", "completion": " " + description}
+        for tag, description in pairs
+    ]
 
 
 def save_prompt_completion_jsonl(
@@ -128,9 +238,12 @@ def save_prompt_completion_jsonl(
 
     target_path = Path(path)
     target_path.parent.mkdir(parents=True, exist_ok=True)
-    with target_path.open("w", encoding="utf-8") as fh:
-        for record in data:
-            json.dump(record, fh, ensure_ascii=False)
-            fh.write("\n")
+    records = iter(data)
+    with target_path.open("wb") as fh:
+        while True:
+            batch = list(islice(records, _JSONL_BATCH_SIZE))
+            if not batch:
+                break
+            fh.write(_encode_jsonl_batch(batch))
     return target_path
 
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import argparse
+import sys
 from collections.abc import Callable, Sequence
 from pathlib import Path
 from typing import Any
@@ -49,6 +50,14 @@ def parse_args() -> argparse.Namespace:
             "the dataset."
         ),
     )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help=(
+            "Reuse a pickled parse of the dataset stored beside it. Only enable "
+            "this for dataset directories you trust."
+        ),
+    )
     return parser.parse_args()
 
 
@@ -71,7 +80,7 @@ def create_generator(model: str, pairs: Sequence[tuple[str, str]]) -> LocalHTMLT
             f"{model!r}."
         )
 
-    tag_to_description = {tag: description for tag, description in pairs}
+    tag_to_description = dict(pairs)
     return LocalHTMLTagLLM(tag_to_description)
 
 
@@ -100,27 +109,48 @@ def _call_hf_generator(
     )
 
 
-def generate_text(
+def bind_generator(
     generator: LocalHTMLTagLLM | Callable[[str, int, int], Sequence[dict[str, Any]]],
-    prompt: str,
-    max_length: int,
     *,
     num_return_sequences: int = 1,
-) -> str:
-    """Generate a completion for the provided prompt using the selected LLM."""
+) -> Callable[[str, int], str]:
+    """Resolve how to call ``generator`` once and return a direct callable.
+
+    The returned function takes ``(prompt, max_length)`` so that demo loops pay
+    for a plain call per prompt instead of re-inspecting the generator.
+    """
 
     if hasattr(generator, "generate"):
         # ``LocalHTMLTagLLM`` exposes a ``generate`` method matching this API.
-        return generator.generate(prompt, max_length)  # type: ignore[return-value]
+        return generator.generate  # type: ignore[return-value]
 
     if callable(generator):
-        return _call_hf_generator(generator, prompt, max_length, num_return_sequences)
+
+        def call(prompt: str, max_length: int) -> str:
+            return _call_hf_generator(
+                generator, prompt, max_length, num_return_sequences
+            )
+
+        return call
 
     raise TypeError("Generator must expose a 'generate' method or be callable.")
 
 
+def generate_text(
+    generator: LocalHTMLTagLLM | Callable[[str, int, int], Sequence[dict[str, Any]]],
+    prompt: str,
+    max_length: int,
+    *,
+    num_return_sequences: int = 1,
+) -> str:
+    """Generate a completion for the provided prompt using the selected LLM."""
+
+    call = bind_generator(generator, num_return_sequences=num_return_sequences)
+    return call(prompt, max_length)
+
+
 def run_dataset_demo(
-    prompts: Sequence[str], generator: LocalHTMLTagLLM, max_length: int
+    prompts: Sequence[str], generate: Callable[[str, int], str], max_length: int
 ) -> None:
     """Run the canned dataset demonstration."""
 
@@ -129,20 +159,54 @@ def run_dataset_demo(
         print("Prompt:")
         print(prompt)
         print("\nGenerated:")
-        print(generate_text(generator, prompt, max_length))
+        print(generate(prompt, max_length))
+
+
+def _prompt_reader() -> Callable[[], str | None]:
+    """Return a function that reads the next prompt, or ``None`` at EOF.
 
+    Terminals get the usual ``input`` prompt.  Piped or scripted input skips
+    the prompt text and the text-layer buffering, reading raw lines straight
+    from ``sys.stdin.buffer`` instead.
+    """
 
-def run_interactive_session(generator: LocalHTMLTagLLM, max_length: int) -> None:
+    stdin = sys.stdin
+    buffer = getattr(stdin, "buffer", None)
+    if buffer is None or stdin.isatty():
+
+        def read_tty() -> str | None:
+            try:
+                return input("Prompt> ")
+            except EOFError:
+                return None
+
+        return read_tty
+
+    readline = buffer.readline
+    encoding = stdin.encoding or "utf-8"
+
+    def read_pipe() -> str | None:
+        line = readline()
+        if not line:
+            return None
+        return line.decode(encoding).rstrip("\r\n")
+
+    return read_pipe
+
+
+def run_interactive_session(
+    generate: Callable[[str, int], str], max_length: int
+) -> None:
     """Interactively prompt the user for text to feed to the LLM."""
 
     print(
         "Enter a prompt to query the built-in HTML tag LLM "
         "(press Ctrl-D to exit)."
     )
+    read_prompt = _prompt_reader()
     while True:
-        try:
-            prompt = input("Prompt> ")
-        except EOFError:
+        prompt = read_prompt()
+        if prompt is None:
             print()  # Add a trailing newline for clean exits.
             break
 
@@ -150,23 +214,24 @@ def run_interactive_session(generator: LocalHTMLTagLLM, max_length: int) -> None
             continue
 
         print("\nGenerated:")
-        print(generate_text(generator, prompt, max_length))
+        print(generate(prompt, max_length))
         print("=" * 80)
 
 
 def main() -> None:
     args = parse_args()
-    pairs = load_html_tag_dataset(args.dataset)
+    pairs = load_html_tag_dataset(args.dataset, cache=args.cache)
     generator = create_generator(args.model, pairs)
+    generate = bind_generator(generator)
     print("Loaded the repository's local html-tag-llm persona.")
 
     if args.interactive:
-        run_interactive_session(generator, args.max_length)
+        run_interactive_session(generate, args.max_length)
         return
 
     prompt_completion = build_prompt_completion_pairs(pairs)
     prompts = choose_prompts(prompt_completion)
-    run_dataset_demo(prompts, generator, args.max_length)
+    run_dataset_demo(prompts, generate, args.max_length)
 
 
 if __name__ == "__main__":
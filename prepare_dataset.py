@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
-import argparse
+import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from dataset_utils import (
     build_prompt_completion_pairs,
@@ -11,8 +12,17 @@ from dataset_utils import (
     save_prompt_completion_jsonl,
 )
 
+if TYPE_CHECKING:
+    import argparse
+
+DEFAULT_INPUT = Path(__file__).with_name("dataset.txt")
+DEFAULT_OUTPUT = Path("data/html_cheatsheet.jsonl")
+
 
 def parse_args() -> argparse.Namespace:
+    # Imported lazily: the common zero-argument invocation never needs it.
+    import argparse
+
     parser = argparse.ArgumentParser(
         description=(
             "Convert the raw HTML cheatsheet into prompt/completion JSONL that "
@@ -22,14 +32,14 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "input",
         nargs="?",
-        default=Path(__file__).with_name("dataset.txt"),
+        default=DEFAULT_INPUT,
         type=Path,
         help="Path to the source dataset (defaults to dataset.txt in the repo).",
     )
     parser.add_argument(
         "output",
         nargs="?",
-        default=Path("data/html_cheatsheet.jsonl"),
+        default=DEFAULT_OUTPUT,
         type=Path,
         help="Destination for the generated JSONL file.",
     )
@@ -37,10 +47,15 @@ def parse_args() -> argparse.Namespace:
 
 
 def main() -> None:
-    args = parse_args()
-    pairs = load_html_tag_dataset(args.input)
+    if len(sys.argv) == 1:
+        input_path, output_path = DEFAULT_INPUT, DEFAULT_OUTPUT
+    else:
+        args = parse_args()
+        input_path, output_path = args.input, args.output
+
+    pairs = load_html_tag_dataset(input_path)
     prompt_completion = build_prompt_completion_pairs(pairs)
-    target_path = save_prompt_completion_jsonl(prompt_completion, args.output)
+    target_path = save_prompt_completion_jsonl(prompt_completion, output_path)
     print(f"Wrote {len(prompt_completion)} prompt/completion pairs to {target_path}.")
 
 
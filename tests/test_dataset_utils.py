@@ -1,9 +1,18 @@
 from __future__ import annotations
 
+import json
+import os
+import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
-from dataset_utils import build_prompt_completion_pairs, load_html_tag_dataset
+import dataset_utils
+from dataset_utils import (
+    build_prompt_completion_pairs,
+    load_html_tag_dataset,
+    save_prompt_completion_jsonl,
+)
 
 
 class DatasetUtilsTestCase(unittest.TestCase):
@@ -29,6 +38,77 @@ class DatasetUtilsTestCase(unittest.TestCase):
             mapping[key],
         )
 
+    def test_descriptions_are_whitespace_normalised(self) -> None:
+        # ``build_prompt_completion_pairs`` relies on this invariant.
+        for _, description in load_html_tag_dataset(self.dataset_path):
+            self.assertEqual(description, " ".join(description.split()))
+
+    def test_headings_and_tags_without_descriptions_are_skipped(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "dataset.txt"
+            path.write_text(
+                "Heading\n<br>\n<p> </p>\n  Starts a\n paragraph  \n\n"
+                "Loose note\n<hr>\nAdds a rule\n",
+                encoding="utf-8",
+            )
+            pairs = load_html_tag_dataset(path)
+        self.assertEqual(
+            pairs, [("<p> </p>", "Starts a paragraph"), ("<hr>", "Adds a rule")]
+        )
+
+    def test_parsed_pairs_are_cached_until_the_dataset_changes(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "dataset.txt"
+            path.write_text("<hr>\nAdds a rule\n", encoding="utf-8")
+            self.assertEqual(
+                load_html_tag_dataset(path, cache=True), [("<hr>", "Adds a rule")]
+            )
+            self.assertTrue((Path(tmp) / "dataset.txt.pkl").exists())
+
+            with mock.patch.object(dataset_utils, "_parse_html_tag_text") as parse:
+                self.assertEqual(
+                    load_html_tag_dataset(path, cache=True), [("<hr>", "Adds a rule")]
+                )
+            parse.assert_not_called()
+
+            path.write_text("<hr>\nAdds a horizontal rule\n", encoding="utf-8")
+            self.assertEqual(
+                load_html_tag_dataset(path, cache=True),
+                [("<hr>", "Adds a horizontal rule")],
+            )
+
+    def test_cache_is_off_by_default(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "dataset.txt"
+            path.write_text("<hr>\nAdds a rule\n", encoding="utf-8")
+            load_html_tag_dataset(path)
+            self.assertEqual([p.name for p in Path(tmp).iterdir()], ["dataset.txt"])
+
+    def test_cache_never_overwrites_a_pkl_dataset(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "data.pkl"
+            path.write_text("<hr>\nAdds a rule\n", encoding="utf-8")
+            for _ in range(2):
+                self.assertEqual(
+                    load_html_tag_dataset(path, cache=True), [("<hr>", "Adds a rule")]
+                )
+            self.assertEqual(path.read_text(encoding="utf-8"), "<hr>\nAdds a rule\n")
+
+    def test_datasets_sharing_a_stem_do_not_share_a_cache(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            txt = Path(tmp) / "x.txt"
+            md = Path(tmp) / "x.md"
+            txt.write_text("<hr>\nAdds a rule\n", encoding="utf-8")
+            md.write_text("<br>\nBreaks line\n", encoding="utf-8")
+            stat = txt.stat()
+            os.utime(md, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            self.assertEqual(
+                load_html_tag_dataset(txt, cache=True), [("<hr>", "Adds a rule")]
+            )
+            self.assertEqual(
+                load_html_tag_dataset(md, cache=True), [("<br>", "Breaks line")]
+            )
+
     def test_prompt_completion_format(self) -> None:
         pairs = load_html_tag_dataset(self.dataset_path)
         prompt_completion = build_prompt_completion_pairs(pairs[:2])
@@ -36,6 +116,28 @@ class DatasetUtilsTestCase(unittest.TestCase):
         self.assertTrue(prompt_completion[0]["prompt"].startswith("Describe"))
         self.assertTrue(prompt_completion[0]["completion"].startswith(" "))
 
+    def test_save_jsonl_writes_one_record_per_line(self) -> None:
+        records = [
+            {"prompt": "Describe `<p>`.", "completion": " Paragraph – text"},
+            {"prompt": "Describe `<hr>`.", "completion": " Rule"},
+        ]
+        with tempfile.TemporaryDirectory() as tmp:
+            target = save_prompt_completion_jsonl(
+                iter(records), Path(tmp) / "out" / "data.jsonl"
+            )
+            content = target.read_text(encoding="utf-8")
+        self.assertTrue(content.endswith("\n"))
+        self.assertIn("–", content)
+        self.assertEqual([json.loads(line) for line in content.splitlines()], records)
+
+    def test_save_jsonl_output_does_not_depend_on_orjson(self) -> None:
+        records = [{"prompt": "Describe `<p>`.", "completion": " Paragraph – text"}]
+        with tempfile.TemporaryDirectory() as tmp:
+            first = save_prompt_completion_jsonl(records, Path(tmp) / "a.jsonl")
+            with mock.patch.object(dataset_utils, "orjson", None):
+                second = save_prompt_completion_jsonl(records, Path(tmp) / "b.jsonl")
+            self.assertEqual(first.read_bytes(), second.read_bytes())
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,9 +1,18 @@
 from __future__ import annotations
 
+import contextlib
+import io
 import unittest
+from unittest import mock
 
-from llm_demo import LocalHTMLTagLLM, choose_prompts, generate_text
-from llm_demo import choose_prompts, generate_text
+import model
+from llm_demo import (
+    LocalHTMLTagLLM,
+    bind_generator,
+    choose_prompts,
+    generate_text,
+    run_interactive_session,
+)
 
 
 class DummyGenerator:
@@ -15,6 +24,29 @@ class DummyGenerator:
         return [{"generated_text": f"reply to: {prompt}"}]
 
 
+class FakeAutomaton:
+    """Brute-force stand-in for ``ahocorasick.Automaton``."""
+
+    def __init__(self) -> None:
+        self.words: dict[str, object] = {}
+
+    def add_word(self, key: str, value: object) -> None:
+        self.words[key] = value
+
+    def make_automaton(self) -> None:
+        pass
+
+    def iter(self, text: str):
+        # Like pyahocorasick, yield ``(end_index, value)`` ordered by end index.
+        hits = []
+        for key, value in self.words.items():
+            start = text.find(key)
+            while start != -1:
+                hits.append((start + len(key) - 1, value))
+                start = text.find(key, start + 1)
+        return iter(sorted(hits, key=lambda hit: hit[0]))
+
+
 class LLMDemoHelpersTestCase(unittest.TestCase):
     def test_choose_prompts_returns_first_three(self) -> None:
         prompts = choose_prompts(
@@ -36,12 +68,90 @@ class LLMDemoHelpersTestCase(unittest.TestCase):
         generator = LocalHTMLTagLLM({"<a>": "Defines a hyperlink."})
         output = generate_text(generator, "What is a widget?", max_length=50)
         self.assertIn("tiny in-repo language model", output)
+
+    def test_generate_text_falls_back_to_tag_name(self) -> None:
+        generator = LocalHTMLTagLLM(
+            {"<a>": "Defines a hyperlink.", "<section>": "Defines a section."}
+        )
+        output = generate_text(generator, "What does section do?", max_length=80)
+        self.assertEqual(output, "Defines a section.")
+        output = generate_text(generator, "Explain sections", max_length=80)
+        self.assertIn("tiny in-repo language model", output)
+
+    def test_fallback_prefers_the_most_specific_tag(self) -> None:
+        generator = LocalHTMLTagLLM(
+            {"<td>": "Defines a cell.", "<td nowrap>": "Prevents wrapping."}
+        )
+        output = generate_text(generator, "Explain td nowrap please", max_length=80)
+        self.assertEqual(output, "Prevents wrapping.")
+        output = generate_text(generator, "Explain td nowrapping", max_length=80)
+        self.assertEqual(output, "Defines a cell.")
+
+    def test_fallback_with_aho_corasick_backend(self) -> None:
+        fake_module = mock.Mock(Automaton=FakeAutomaton)
+        model._build_fallback_matcher.cache_clear()
+        self.addCleanup(model._build_fallback_matcher.cache_clear)
+        with mock.patch.object(model, "ahocorasick", fake_module):
+            generator = LocalHTMLTagLLM(
+                {
+                    "<td>": "Defines a cell.",
+                    "<td nowrap>": "Prevents wrapping.",
+                    "<nowrap>": "Nowrap alone.",
+                    "<section>": "Defines a section.",
+                }
+            )
+            self.assertIsInstance(generator._automaton, FakeAutomaton)
+            self.assertIsNone(generator._fallback_re)
+
+            # Leftmost match first, then the most specific tag at that offset.
+            self.assertEqual(
+                generator.generate("Explain td nowrap please", 80),
+                "Prevents wrapping.",
+            )
+            self.assertEqual(
+                generator.generate("Explain td nowrapping", 80), "Defines a cell."
+            )
+            self.assertEqual(
+                generator.generate("nowrap or td?", 80), "Nowrap alone."
+            )
+            # Whole words only, including a match at the very end of the prompt.
+            self.assertEqual(
+                generator.generate("Tell me about section", 80),
+                "Defines a section.",
+            )
+            self.assertIn(
+                "tiny in-repo language model",
+                generator.generate("Explain sections and xtd", 80),
+            )
+
     def test_generate_text_uses_generator(self) -> None:
         generator = DummyGenerator()
         output = generate_text(generator, "Hello world", max_length=42)
         self.assertEqual(output, "reply to: Hello world")
         self.assertEqual(generator.calls, [("Hello world", 42, 1)])
 
+    def test_bind_generator_resolves_dispatch_once(self) -> None:
+        local = LocalHTMLTagLLM({"<a>": "Defines a hyperlink."})
+        self.assertEqual(bind_generator(local), local.generate)
+
+        dummy = DummyGenerator()
+        call = bind_generator(dummy, num_return_sequences=2)
+        self.assertEqual(call("Hi", 10), "reply to: Hi")
+        self.assertEqual(dummy.calls, [("Hi", 10, 2)])
+
+        with self.assertRaises(TypeError):
+            bind_generator(object())
+
+    def test_interactive_session_reads_piped_stdin(self) -> None:
+        generator = LocalHTMLTagLLM({"<a>": "Defines a hyperlink."})
+        stdin = io.TextIOWrapper(io.BytesIO(b"Describe `<a>`.\r\n\n"), "utf-8")
+        stdout = io.StringIO()
+        with mock.patch("sys.stdin", stdin), contextlib.redirect_stdout(stdout):
+            run_interactive_session(bind_generator(generator), max_length=80)
+        output = stdout.getvalue()
+        self.assertEqual(output.count("Defines a hyperlink."), 1)
+        self.assertNotIn("Prompt>", output)
+
 
 if __name__ == "__main__":
     unittest.main()